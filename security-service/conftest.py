@@ -0,0 +1,6 @@
+# Keeps the service root on sys.path so tests can import `routers` and `services`.
+import os
+
+# services.encryption loads the key at import time; provide a test key so the
+# suite runs without CI's env block (an exported key still takes precedence).
+os.environ.setdefault("VAULT_ENCRYPTION_KEY", "00" * 32)
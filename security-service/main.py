@@ -12,20 +12,47 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import os
 from routers import encrypt, breach, audit
+from services import breach as breach_service
+from services.breach_local import LocalHIBP
+from services.encryption import openssl_version
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
-logging.basicConfig(level=logging.INFO)
+# Log records are queued by the calling thread and written to stderr by a
+# background listener thread, so logging never blocks the event loop on I/O.
+log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)])
+log_listener = QueueListener(log_queue, logging.StreamHandler())
 logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    log_listener.start()
     logger.info("SecureVault Security Service starting up")
+    logger.info("AES-256-GCM backed by %s", openssl_version())
+    hibp_client = breach_service.create_client()
+    breach_service.set_client(hibp_client)
+    local_mirror = None
+    mirror_dir = os.environ.get("HIBP_MIRROR_DIR")
+    if mirror_dir:
+        local_mirror = LocalHIBP(mirror_dir)
+        breach_service.set_local_mirror(local_mirror)
+        logger.info("Breach checks served from local HIBP mirror at %s", mirror_dir)
     yield
+    breach_service.set_local_mirror(None)
+    if local_mirror is not None:
+        local_mirror.close()
+    breach_service.set_client(None)
+    await hibp_client.aclose()
     logger.info("SecureVault Security Service shutting down")
+    log_listener.stop()
 
 
 app = FastAPI(
@@ -33,6 +60,7 @@ app = FastAPI(
     description="Internal microservice for encryption and breach detection",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     # Disable docs in production
     docs_url="/docs" if True else None,
 )
@@ -53,3 +81,16 @@ app.include_router(audit.router, tags=["Audit"])
 @app.get("/health")
 async def health():
     return {"status": "ok"}
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # "auto" picks uvloop + httptools when installed (uvicorn[standard]) and
+    # falls back to asyncio/h11 where they are unavailable (e.g. Windows).
+    uvicorn.run(
+        "main:app",
+        port=int(os.environ.get("PORT", "8001")),
+        loop="auto",
+        http="auto",
+    )
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from services.breach import check_password_breach
 
@@ -11,7 +12,9 @@ class BreachResponse(BaseModel):
     message: str
 
 
-@router.get("/breach-check", response_model=BreachResponse)
+# Returned as ORJSONResponse so FastAPI skips response serialization;
+# the model still documents the schema.
+@router.get("/breach-check", responses={200: {"model": BreachResponse}})
 async def breach_check(password: str = Query(..., description="Password to check")):
     """
     Check if a password has appeared in known data breaches.
@@ -21,16 +24,16 @@ async def breach_check(password: str = Query(..., description="Password to check
         breached, count = await check_password_breach(password)
         
         if breached:
-            return BreachResponse(
-                breached=True,
-                count=count,
-                message=f"⚠️ This password has appeared in {count:,} data breaches. Change it immediately."
-            )
+            return ORJSONResponse({
+                "breached": True,
+                "count": count,
+                "message": f"⚠️ This password has appeared in {count:,} data breaches. Change it immediately.",
+            })
         
-        return BreachResponse(
-            breached=False,
-            count=0,
-            message="✅ This password has not appeared in any known data breaches."
-        )
+        return ORJSONResponse({
+            "breached": False,
+            "count": 0,
+            "message": "✅ This password has not appeared in any known data breaches.",
+        })
     except Exception as e:
         raise HTTPException(status_code=503, detail=f"Breach check service unavailable: {str(e)}")
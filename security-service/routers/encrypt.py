@@ -1,6 +1,9 @@
+import asyncio
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-from services.encryption import encrypt, decrypt
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field
+from typing import List
+from services.encryption import encrypt, encrypt_batch, decrypt
 from cryptography.exceptions import InvalidTag
 
 router = APIRouter()
@@ -10,6 +13,14 @@ class EncryptRequest(BaseModel):
     plaintext: str
 
 
+# Upper bound on entries per /encrypt-batch request; larger imports must be chunked
+MAX_BATCH_SIZE = 1000
+
+
+class EncryptBatchRequest(BaseModel):
+    plaintexts: List[str] = Field(..., max_length=MAX_BATCH_SIZE)
+
+
 class DecryptRequest(BaseModel):
     ciphertext: str
     iv: str
@@ -24,6 +35,19 @@ async def encrypt_endpoint(req: EncryptRequest):
     return encrypt(req.plaintext)
 
 
+@router.post("/encrypt-batch")
+async def encrypt_batch_endpoint(req: EncryptBatchRequest):
+    """Encrypt many plaintexts with AES-256-GCM in a single request."""
+    if any(not plaintext for plaintext in req.plaintexts):
+        raise HTTPException(status_code=400, detail="Plaintext cannot be empty")
+    # One worker thread for the whole batch — per-entry dispatch would cost
+    # more than encrypting a typical vault entry
+    results = await asyncio.to_thread(encrypt_batch, req.plaintexts)
+    # Hand the list straight to orjson; a plain dict would go through
+    # jsonable_encoder on the event loop, costing more than the encryption
+    return ORJSONResponse({"results": results})
+
+
 @router.post("/decrypt")
 async def decrypt_endpoint(req: DecryptRequest):
     """Decrypt AES-256-GCM ciphertext. Returns 422 if content was tampered with."""
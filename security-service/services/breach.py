@@ -16,13 +16,103 @@ The full hash NEVER leaves this service.
 This is the same technique used by 1Password and Firefox Monitor.
 """
 
+import asyncio
 import hashlib
+import time
 import httpx
-from typing import Tuple
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from services.breach_local import LocalHIBP
 
 
 HIBP_API_URL = "https://api.pwnedpasswords.com/range"
 
+HIBP_HEADERS = {
+    "Add-Padding": "true",  # Prevents traffic analysis attacks
+    "User-Agent": "SecureVault/1.0",
+}
+
+# Shared client so repeated checks reuse pooled (HTTP/2) connections to HIBP
+# instead of paying a fresh TCP + TLS handshake on every request.
+# Owned by the application lifespan — see main.py.
+_client: Optional[httpx.AsyncClient] = None
+
+# Optional offline mirror (see services/breach_local.py). When installed,
+# lookups are answered locally and HIBP is never contacted.
+_local_mirror: Optional[LocalHIBP] = None
+
+# Parsed HIBP range responses (suffix → count) keyed by 5-char prefix, so
+# different passwords sharing a prefix are answered from one fetch.
+# HIBP data changes rarely; entries expire after PREFIX_CACHE_TTL seconds.
+# Each table holds ~900 suffixes (~130 KB), so a full cache is ~32 MB.
+PREFIX_CACHE_MAX = 256
+PREFIX_CACHE_TTL = 3600
+_prefix_cache: "OrderedDict[str, Tuple[float, Dict[str, int]]]" = OrderedDict()
+
+
+def create_client() -> httpx.AsyncClient:
+    """Build the pooled HTTP client used for HIBP range queries."""
+    return httpx.AsyncClient(
+        timeout=5.0,
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+    )
+
+
+def set_client(client: Optional[httpx.AsyncClient]) -> None:
+    """Install (or clear, with None) the shared HIBP client."""
+    global _client
+    _client = client
+
+
+def set_local_mirror(mirror: Optional[LocalHIBP]) -> None:
+    """Install (or clear, with None) the local HIBP mirror."""
+    global _local_mirror
+    _local_mirror = mirror
+
+
+async def _read_range(client: httpx.AsyncClient, prefix: str) -> Dict[str, int]:
+    """
+    Stream the HIBP range for a 5-char hash prefix into a suffix → count table.
+    
+    Lines are parsed as they arrive, so the ~30 KB body is never
+    materialized as a single string and then split a second time.
+    """
+    table = {}
+    async with client.stream("GET", f"{HIBP_API_URL}/{prefix}", headers=HIBP_HEADERS) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            returned_suffix, _, count = line.partition(":")
+            if count:
+                table[returned_suffix] = int(count)
+    return table
+
+
+async def _fetch_range(prefix: str) -> Dict[str, int]:
+    """Fetch and parse the HIBP range for a 5-char hash prefix."""
+    if _client is not None:
+        return await _read_range(_client, prefix)
+    # No shared client installed (e.g. called outside the app lifespan)
+    async with httpx.AsyncClient(timeout=5.0) as client:
+        return await _read_range(client, prefix)
+
+
+async def _get_range_table(prefix: str) -> Dict[str, int]:
+    """Return the suffix → count table for a prefix, fetching it if not cached."""
+    now = time.monotonic()
+    cached = _prefix_cache.get(prefix)
+    if cached is not None and cached[0] > now:
+        _prefix_cache.move_to_end(prefix)
+        return cached[1]
+    
+    table = await _fetch_range(prefix)
+    
+    _prefix_cache[prefix] = (now + PREFIX_CACHE_TTL, table)
+    _prefix_cache.move_to_end(prefix)
+    if len(_prefix_cache) > PREFIX_CACHE_MAX:
+        _prefix_cache.popitem(last=False)
+    return table
+
 
 async def check_password_breach(password: str) -> Tuple[bool, int]:
     """
@@ -34,31 +124,29 @@ async def check_password_breach(password: str) -> Tuple[bool, int]:
     Returns:
         Tuple of (is_breached: bool, breach_count: int)
     """
-    # Step 1: Hash the password with SHA-1
-    sha1_hash = hashlib.sha1(password.encode('utf-8')).hexdigest().upper()
+    # Step 1: Hash the password with SHA-1.
+    # SHA-1 is only the HIBP lookup key here, not a security primitive, so
+    # usedforsecurity=False keeps it available on FIPS-restricted OpenSSL builds.
+    sha1 = hashlib.sha1(password.encode('utf-8'), usedforsecurity=False)
+    
+    if _local_mirror is not None:
+        # A cold lookup page-faults through the mmap'd shard — keep that
+        # disk I/O off the event loop
+        return await asyncio.to_thread(_local_mirror.lookup, sha1.digest())
+    
+    sha1_hash = sha1.hexdigest().upper()
     
     # Step 2: Split into prefix (5 chars) and suffix
     prefix = sha1_hash[:5]
     suffix = sha1_hash[5:]
     
-    # Step 3: Send only the prefix to HIBP
-    async with httpx.AsyncClient(timeout=5.0) as client:
-        response = await client.get(
-            f"{HIBP_API_URL}/{prefix}",
-            headers={
-                "Add-Padding": "true",  # Prevents traffic analysis attacks
-                "User-Agent": "SecureVault/1.0",
-            }
-        )
-        response.raise_for_status()
-    
-    # Step 4: Search the returned list locally for our suffix
-    lines = response.text.splitlines()
+    # Step 3: Send only the prefix to HIBP (or reuse a cached range)
+    table = await _get_range_table(prefix)
     
-    for line in lines:
-        returned_suffix, count = line.split(":")
-        if returned_suffix.upper() == suffix:
-            return True, int(count)
+    # Step 4: Look up our suffix locally
+    count = table.get(suffix)
     
     # Step 5: Not found → password is clean
-    return False, 0
+    if count is None:
+        return False, 0
+    return True, count
@@ -0,0 +1,146 @@
+"""
+Local HaveIBeenPwned Mirror
+============================
+Offline alternative to the HIBP range API for bulk vault audits.
+
+The Pwned Passwords SHA-1 list is split into 256 shard files by the first
+byte of the hash (00.bin … ff.bin). Each shard holds fixed-width records,
+sorted by hash:
+
+    20 bytes  SHA-1 digest
+     4 bytes  breach count (unsigned, little-endian)
+
+A lookup memory-maps the shard and binary-searches it — ~20 comparisons
+against pages the OS keeps cached, with no network round-trip at all.
+Nothing leaves the machine, so this is strictly more private than the
+k-anonymity API.
+"""
+
+import bisect
+import mmap
+import os
+import struct
+import sys
+import threading
+from typing import Dict, Iterable, Tuple
+
+
+RECORD_SIZE = 24
+DIGEST_SIZE = 20
+_COUNT = struct.Struct("<I")
+
+
+class _DigestView:
+    """Read-only sequence of the digests in a shard, for use with bisect."""
+
+    def __init__(self, buf: mmap.mmap):
+        self._buf = buf
+        self._len = len(buf) // RECORD_SIZE
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, i: int) -> bytes:
+        offset = i * RECORD_SIZE
+        return self._buf[offset:offset + DIGEST_SIZE]
+
+
+class LocalHIBP:
+    """Memory-mapped, prefix-sharded Pwned Passwords mirror."""
+
+    def __init__(self, root: str):
+        if not os.path.isdir(root):
+            raise RuntimeError(f"HIBP mirror directory not found: {root}")
+        # Verify every shard up front so an empty or half-built mirror stops
+        # the service at startup instead of failing lookups later.
+        for first_byte in range(256):
+            path = os.path.join(root, f"{first_byte:02x}.bin")
+            if not os.path.isfile(path):
+                raise RuntimeError(f"HIBP mirror shard missing: {path}")
+            if os.path.getsize(path) == 0:
+                raise RuntimeError(f"HIBP mirror shard is empty: {path}")
+        self.root = root
+        self._shards: Dict[int, Tuple[mmap.mmap, _DigestView]] = {}
+        self._lock = threading.Lock()
+
+    def _shard(self, first_byte: int) -> Tuple[mmap.mmap, _DigestView]:
+        shard = self._shards.get(first_byte)
+        if shard is None:
+            with self._lock:
+                shard = self._shards.get(first_byte)
+                if shard is None:
+                    path = os.path.join(self.root, f"{first_byte:02x}.bin")
+                    # A missing shard means an incomplete mirror — fail loudly
+                    # rather than reporting every password in it as clean.
+                    with open(path, "rb") as f:
+                        if os.fstat(f.fileno()).st_size == 0:
+                            raise RuntimeError(f"HIBP mirror shard is empty: {path}")
+                        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    shard = (buf, _DigestView(buf))
+                    self._shards[first_byte] = shard
+        return shard
+
+    def lookup(self, digest: bytes) -> Tuple[bool, int]:
+        """
+        Look up a raw 20-byte SHA-1 digest.
+
+        Returns:
+            Tuple of (is_breached: bool, breach_count: int)
+        """
+        buf, digests = self._shard(digest[0])
+        i = bisect.bisect_left(digests, digest)
+        if i < len(digests) and digests[i] == digest:
+            offset = i * RECORD_SIZE + DIGEST_SIZE
+            return True, _COUNT.unpack_from(buf, offset)[0]
+        return False, 0
+
+    def close(self) -> None:
+        with self._lock:
+            for buf, _ in self._shards.values():
+                buf.close()
+            self._shards.clear()
+
+
+def build_shards(lines: Iterable[str], root: str) -> None:
+    """
+    Build a mirror from the "HASH:COUNT" lines of the Pwned Passwords
+    SHA-1 download (ordered by hash, as published).
+    
+    Raises:
+        ValueError if a hash is malformed or the input is not strictly
+        ordered — out-of-order records would overwrite earlier shards and
+        break the binary search, reporting breached passwords as clean.
+    """
+    os.makedirs(root, exist_ok=True)
+    current = None
+    previous = b""
+    out = None
+    try:
+        for line_no, line in enumerate(lines, start=1):
+            hex_hash, _, count = line.strip().partition(":")
+            if not count:
+                continue
+            digest = bytes.fromhex(hex_hash)
+            if len(digest) != DIGEST_SIZE:
+                raise ValueError(f"line {line_no}: expected a 40-char SHA-1 hash")
+            if digest <= previous:
+                raise ValueError(f"line {line_no}: input is not strictly ordered by hash")
+            previous = digest
+            if digest[0] != current:
+                if out is not None:
+                    out.close()
+                current = digest[0]
+                out = open(os.path.join(root, f"{current:02x}.bin"), "wb")
+            out.write(digest)
+            out.write(_COUNT.pack(int(count)))
+    finally:
+        if out is not None:
+            out.close()
+
+
+if __name__ == "__main__":
+    # python -m services.breach_local pwned-passwords-sha1-ordered-by-hash.txt /var/lib/securevault/hibp
+    if len(sys.argv) != 3:
+        sys.exit("usage: python -m services.breach_local <hashes.txt> <mirror-dir>")
+    with open(sys.argv[1], "r", encoding="ascii") as f:
+        build_shards(f, sys.argv[2])
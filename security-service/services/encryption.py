@@ -14,11 +14,19 @@ Tag: 128-bit authentication tag stored alongside ciphertext
 """
 
 import os
-import base64
+import binascii
+import functools
 import secrets
+from typing import List
+from cryptography.hazmat.backends.openssl.backend import backend
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 
+def openssl_version() -> str:
+    """Return the OpenSSL build that performs the AES-GCM operations."""
+    return backend.openssl_version_text()
+
+
 def _load_key() -> bytes:
     """Load encryption key from environment variable."""
     key_hex = os.environ.get("VAULT_ENCRYPTION_KEY")
@@ -32,6 +40,36 @@ def _load_key() -> bytes:
     return key_bytes
 
 
+# The key is fixed for the lifetime of the process, so it is decoded once at
+# import time — a missing or malformed key stops the service from starting
+# instead of failing each request.
+_KEY_BYTES: bytes = _load_key()
+
+
+@functools.cache
+def _get_aesgcm() -> AESGCM:
+    """Return the process-wide AESGCM instance (safe to share across threads)."""
+    return AESGCM(_KEY_BYTES)
+
+
+def _seal(aesgcm: AESGCM, iv: bytes, plaintext: str) -> dict:
+    """Encrypt one plaintext under the given IV and base64-encode the parts."""
+    plaintext_bytes = plaintext.encode('utf-8')
+    
+    # AESGCM.encrypt() returns ciphertext + 16-byte auth tag appended
+    ciphertext_with_tag = aesgcm.encrypt(iv, plaintext_bytes, None)
+    
+    # Split ciphertext and tag (tag is last 16 bytes)
+    ciphertext = ciphertext_with_tag[:-16]
+    tag = ciphertext_with_tag[-16:]
+    
+    return {
+        "ciphertext": binascii.b2a_base64(ciphertext, newline=False).decode('ascii'),
+        "iv": binascii.b2a_base64(iv, newline=False).decode('ascii'),
+        "tag": binascii.b2a_base64(tag, newline=False).decode('ascii'),
+    }
+
+
 def encrypt(plaintext: str) -> dict:
     """
     Encrypt plaintext string using AES-256-GCM.
@@ -39,27 +77,31 @@ def encrypt(plaintext: str) -> dict:
     Returns:
         dict with keys: ciphertext (b64), iv (b64), tag (b64)
     """
-    key = _load_key()
-    aesgcm = AESGCM(key)
-    
     # Generate a cryptographically random 96-bit IV — never reuse IVs!
     # IV reuse with GCM is catastrophic — it can reveal the key
     iv = secrets.token_bytes(12)
     
-    plaintext_bytes = plaintext.encode('utf-8')
+    return _seal(_get_aesgcm(), iv, plaintext)
+
+
+def encrypt_batch(plaintexts: List[str]) -> List[dict]:
+    """
+    Encrypt many plaintexts in one call (e.g. a vault import).
     
-    # AESGCM.encrypt() returns ciphertext + 16-byte auth tag appended
-    ciphertext_with_tag = aesgcm.encrypt(iv, plaintext_bytes, None)
+    Returns:
+        list of dicts with keys ciphertext (b64), iv (b64), tag (b64),
+        in the same order as the input
+    """
+    aesgcm = _get_aesgcm()
     
-    # Split ciphertext and tag (tag is last 16 bytes)
-    ciphertext = ciphertext_with_tag[:-16]
-    tag = ciphertext_with_tag[-16:]
+    # One CSPRNG call supplies every IV; each entry still gets its own
+    # independent random 96-bit slice, so IVs are never reused.
+    iv_buf = secrets.token_bytes(12 * len(plaintexts))
     
-    return {
-        "ciphertext": base64.b64encode(ciphertext).decode(),
-        "iv": base64.b64encode(iv).decode(),
-        "tag": base64.b64encode(tag).decode(),
-    }
+    return [
+        _seal(aesgcm, iv_buf[i * 12:(i + 1) * 12], plaintext)
+        for i, plaintext in enumerate(plaintexts)
+    ]
 
 
 def decrypt(ciphertext_b64: str, iv_b64: str, tag_b64: str) -> str:
@@ -69,12 +111,11 @@ def decrypt(ciphertext_b64: str, iv_b64: str, tag_b64: str) -> str:
     Raises:
         cryptography.exceptions.InvalidTag if content was tampered with
     """
-    key = _load_key()
-    aesgcm = AESGCM(key)
+    aesgcm = _get_aesgcm()
     
-    ciphertext = base64.b64decode(ciphertext_b64)
-    iv = base64.b64decode(iv_b64)
-    tag = base64.b64decode(tag_b64)
+    ciphertext = binascii.a2b_base64(ciphertext_b64)
+    iv = binascii.a2b_base64(iv_b64)
+    tag = binascii.a2b_base64(tag_b64)
     
     # GCM verification: if the auth tag doesn't match, raises InvalidTag
     # This means any tampering with the stored data is immediately detected
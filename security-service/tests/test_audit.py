@@ -0,0 +1,49 @@
+from datetime import datetime, timedelta, timezone
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from routers import audit
+
+app = FastAPI()
+app.include_router(audit.router)
+client = TestClient(app)
+
+
+def _iso(days_ago: float) -> str:
+    updated = datetime.now(timezone.utc) - timedelta(days=days_ago)
+    return updated.isoformat().replace("+00:00", "Z")
+
+
+def test_only_old_credentials_are_flagged_stale():
+    response = client.post("/audit", json={
+        "user_id": "user-1",
+        "entries": [
+            {"id": "1", "title": "Fresh Login", "type": "credential", "last_updated": _iso(5)},
+            {"id": "2", "title": "Old Login", "type": "credential", "last_updated": _iso(200)},
+        ],
+    })
+
+    assert response.status_code == 200
+    report = response.json()
+    stale = [r for r in report["recommendations"] if "90+ days" in r]
+    assert len(stale) == 1
+    assert "Old Login" in stale[0]
+    assert "Fresh Login" not in stale[0]
+    assert report["risk_score"] == "MEDIUM"
+    assert report["total_entries"] == 2
+
+
+def test_stale_threshold_is_91_full_days():
+    response = client.post("/audit", json={
+        "user_id": "user-1",
+        "entries": [
+            {"id": "1", "title": "Borderline Login", "type": "credential", "last_updated": _iso(90.5)},
+            {"id": "2", "title": "Stale Login", "type": "credential", "last_updated": _iso(91.5)},
+        ],
+    })
+
+    stale = [r for r in response.json()["recommendations"] if "90+ days" in r]
+    assert len(stale) == 1
+    assert "Stale Login" in stale[0]
+    assert "Borderline Login" not in stale[0]
@@ -0,0 +1,88 @@
+import asyncio
+import hashlib
+from collections import OrderedDict
+
+import httpx
+import pytest
+
+from services import breach
+
+PASSWORD = "password"
+SHA1 = hashlib.sha1(PASSWORD.encode("utf-8")).hexdigest().upper()
+PREFIX, SUFFIX = SHA1[:5], SHA1[5:]
+
+
+@pytest.fixture
+def hibp(monkeypatch):
+    """Serve HIBP ranges from a MockTransport and record requested prefixes."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        prefix = request.url.path.rsplit("/", 1)[-1]
+        requests.append(prefix)
+        lines = ["0018A45C4D1DEF81644B54AB7F969B88D65:3"]
+        if prefix == PREFIX:
+            lines.append(f"{SUFFIX}:12345")
+        # Add-Padding entries carry a count of 0
+        lines.append("FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF:0")
+        return httpx.Response(200, text="\r\n".join(lines))
+
+    monkeypatch.setattr(breach, "_prefix_cache", OrderedDict())
+    breach.set_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    yield requests
+    breach.set_client(None)
+
+
+def test_breached_password_is_reported_with_count(hibp):
+    assert asyncio.run(breach.check_password_breach(PASSWORD)) == (True, 12345)
+
+
+def test_unknown_password_is_clean(hibp):
+    assert asyncio.run(breach.check_password_breach("not-in-the-mock-range")) == (False, 0)
+
+
+def test_range_is_parsed_including_padding_lines(hibp):
+    table = asyncio.run(breach._get_range_table("00000"))
+
+    assert table == {
+        "0018A45C4D1DEF81644B54AB7F969B88D65": 3,
+        "FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF": 0,
+    }
+
+
+def test_prefix_is_fetched_once(hibp):
+    async def check_twice():
+        await breach.check_password_breach(PASSWORD)
+        await breach.check_password_breach(PASSWORD)
+
+    asyncio.run(check_twice())
+
+    assert hibp == [PREFIX]
+
+
+def test_prefix_is_refetched_after_ttl(hibp, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(breach.time, "monotonic", lambda: clock[0])
+
+    asyncio.run(breach.check_password_breach(PASSWORD))
+    clock[0] += breach.PREFIX_CACHE_TTL - 1
+    asyncio.run(breach.check_password_breach(PASSWORD))
+    assert hibp == [PREFIX]
+
+    clock[0] += 2
+    asyncio.run(breach.check_password_breach(PASSWORD))
+    assert hibp == [PREFIX, PREFIX]
+
+
+def test_oldest_prefix_is_evicted_over_limit(hibp, monkeypatch):
+    monkeypatch.setattr(breach, "PREFIX_CACHE_MAX", 2)
+
+    async def fetch(*prefixes):
+        for prefix in prefixes:
+            await breach._get_range_table(prefix)
+
+    # Touching 00000 again makes 00001 the least recently used entry
+    asyncio.run(fetch("00000", "00001", "00000", "00002"))
+
+    assert list(breach._prefix_cache) == ["00000", "00002"]
+    assert hibp == ["00000", "00001", "00002"]
@@ -0,0 +1,59 @@
+import hashlib
+
+import pytest
+
+from services.breach_local import LocalHIBP, build_shards
+
+
+def _sha1(password: str) -> bytes:
+    return hashlib.sha1(password.encode("utf-8")).digest()
+
+
+def test_build_then_lookup_round_trip(tmp_path):
+    passwords = [f"password-{i}" for i in range(2000)]
+    counts = {_sha1(p): i + 1 for i, p in enumerate(passwords)}
+    lines = [f"{digest.hex().upper()}:{count}" for digest, count in sorted(counts.items())]
+
+    build_shards(lines, str(tmp_path))
+
+    mirror = LocalHIBP(str(tmp_path))
+    try:
+        for digest, count in counts.items():
+            assert mirror.lookup(digest) == (True, count)
+
+        # Unlisted hashes land in an existing shard but are not found
+        for password in ("correct horse battery staple", "not-in-the-list"):
+            assert mirror.lookup(_sha1(password)) == (False, 0)
+    finally:
+        mirror.close()
+
+
+def test_build_rejects_unordered_input(tmp_path):
+    low, high = sorted(_sha1(p) for p in ("a", "b"))
+    lines = [f"{high.hex().upper()}:1", f"{low.hex().upper()}:2"]
+
+    with pytest.raises(ValueError, match="not strictly ordered"):
+        build_shards(lines, str(tmp_path))
+
+
+def test_build_rejects_duplicate_hashes(tmp_path):
+    digest = _sha1("a").hex().upper()
+
+    with pytest.raises(ValueError, match="not strictly ordered"):
+        build_shards([f"{digest}:1", f"{digest}:2"], str(tmp_path))
+
+
+def test_incomplete_mirror_is_rejected_at_startup(tmp_path):
+    build_shards([f"{_sha1('a').hex().upper()}:1"], str(tmp_path))
+
+    with pytest.raises(RuntimeError, match="shard missing"):
+        LocalHIBP(str(tmp_path))
+
+
+def test_empty_shard_is_rejected_at_startup(tmp_path):
+    for first_byte in range(256):
+        (tmp_path / f"{first_byte:02x}.bin").write_bytes(b"\0" * 24)
+    (tmp_path / "7f.bin").write_bytes(b"")
+
+    with pytest.raises(RuntimeError, match="shard is empty"):
+        LocalHIBP(str(tmp_path))
@@ -0,0 +1,28 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from routers import encrypt
+
+app = FastAPI()
+app.include_router(encrypt.router)
+client = TestClient(app)
+
+
+def test_encrypt_batch_round_trip():
+    plaintexts = ["alpha", "bravo", "charlie"]
+
+    response = client.post("/encrypt-batch", json={"plaintexts": plaintexts})
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert len({r["iv"] for r in results}) == len(plaintexts)
+    for plaintext, result in zip(plaintexts, results):
+        assert client.post("/decrypt", json=result).json() == {"plaintext": plaintext}
+
+
+def test_encrypt_batch_rejects_oversized_batch():
+    plaintexts = ["x"] * (encrypt.MAX_BATCH_SIZE + 1)
+
+    response = client.post("/encrypt-batch", json={"plaintexts": plaintexts})
+
+    assert response.status_code == 422